@@ -4,6 +4,13 @@ import FormInput from './FormInput';
 import AnimatedBackground from './AnimatedBackground';
 import { Eye, EyeOff, Mail, Lock } from 'lucide-react';
 
+// Dev-only login trace; logs a structured event without the user's email
+const logLoginEvent = (role) => {
+  if (import.meta.env.DEV) {
+    console.info('[login]', { event: 'login_success', role });
+  }
+};
+
 /**
  * LoginPage Component
  * Professional split-screen login page with animated hero section
@@ -59,14 +66,14 @@ const LoginPage = () => {
       const studentPassword = '123';
 
       if (formData.email === teacherEmail && formData.password === teacherPassword) {
-        console.log('Teacher login successful:', formData.email);
+        logLoginEvent('teacher');
         setFormData({ email: '', password: '' });
         // Redirect to Teacher Dashboard on port 1575
         setTimeout(() => {
           window.location.href = 'http://localhost:1575';
         }, 500);
       } else if (formData.email === studentEmail && formData.password === studentPassword) {
-        console.log('Student login successful:', formData.email);
+        logLoginEvent('student');
         setFormData({ email: '', password: '' });
         // Redirect to Student Portal on port 1574
         setTimeout(() => {
@@ -1,26 +1,6 @@
-export default function ConceptSelector({ concepts, onSelectConcept, selectedConceptId }) {
-  const difficultyColor = (level) => {
-    switch(level) {
-      case 1: return '#4ade80'
-      case 2: return '#60a5fa'
-      case 3: return '#facc15'
-      case 4: return '#f97316'
-      case 5: return '#ef4444'
-      default: return '#94a3b8'
-    }
-  }
-
-  const difficultyLabel = (level) => {
-    const labels = {
-      1: 'Intro',
-      2: 'Beginner',
-      3: 'Intermediate',
-      4: 'Advanced',
-      5: 'Expert'
-    }
-    return labels[level] || 'Unknown'
-  }
+import { difficultyColor, difficultyLabel } from '../lib/difficulty'
 
+export default function ConceptSelector({ concepts, onSelectConcept, selectedConceptId }) {
   return (
     <div style={{
       borderRadius: '0.5rem',
@@ -1,4 +1,5 @@
 import { useState } from 'react'
+import { difficultyColor, difficultyLabel } from '../lib/difficulty'
 
 export default function CurrentAssignment({ assignment, concepts, selectedConceptId, onSelectConcept }) {
   const [expandedSubject, setExpandedSubject] = useState(null)
@@ -14,28 +15,6 @@ export default function CurrentAssignment({ assignment, concepts, selectedConcep
 
   const subjects = Object.keys(subjectMap).sort()
 
-  const difficultyColor = (level) => {
-    switch(level) {
-      case 1: return '#4ade80'
-      case 2: return '#60a5fa'
-      case 3: return '#facc15'
-      case 4: return '#f97316'
-      case 5: return '#ef4444'
-      default: return '#94a3b8'
-    }
-  }
-
-  const difficultyLabel = (level) => {
-    const labels = {
-      1: 'Intro',
-      2: 'Beginner',
-      3: 'Intermediate',
-      4: 'Advanced',
-      5: 'Expert'
-    }
-    return labels[level] || 'Unknown'
-  }
-
   return (
     <div style={{ 
       borderRadius: '0.5rem', 
@@ -1,27 +1,12 @@
-export default function IntegrityPanel({ integrityScore, suddenJumpFlag, integrityStatusLabel }) {
-  const getStatusColor = (status) => {
-    switch(status) {
-      case 'CONSISTENT': return '#4ade80'
-      case 'NEEDS_REVIEW': return '#ef4444'
-      default: return '#facc15'
-    }
-  }
+const STATUS_STYLES = {
+  CONSISTENT: { color: '#4ade80', bg: 'rgba(74, 222, 128, 0.1)', border: 'rgba(74, 222, 128, 0.3)' },
+  NEEDS_REVIEW: { color: '#ef4444', bg: 'rgba(239, 68, 68, 0.1)', border: 'rgba(239, 68, 68, 0.3)' }
+}
 
-  const getStatusBg = (status) => {
-    switch(status) {
-      case 'CONSISTENT': return 'rgba(74, 222, 128, 0.1)'
-      case 'NEEDS_REVIEW': return 'rgba(239, 68, 68, 0.1)'
-      default: return 'rgba(250, 204, 21, 0.1)'
-    }
-  }
+const DEFAULT_STATUS_STYLE = { color: '#facc15', bg: 'rgba(250, 204, 21, 0.1)', border: 'rgba(250, 204, 21, 0.3)' }
 
-  const getStatusBorder = (status) => {
-    switch(status) {
-      case 'CONSISTENT': return 'rgba(74, 222, 128, 0.3)'
-      case 'NEEDS_REVIEW': return 'rgba(239, 68, 68, 0.3)'
-      default: return 'rgba(250, 204, 21, 0.3)'
-    }
-  }
+export default function IntegrityPanel({ integrityScore, suddenJumpFlag, integrityStatusLabel }) {
+  const statusStyle = STATUS_STYLES[integrityStatusLabel] || DEFAULT_STATUS_STYLE
 
   const getScoreColor = (score) => {
     if (score >= 0.8) return '#4ade80'
@@ -90,15 +75,15 @@ export default function IntegrityPanel({ integrityScore, suddenJumpFlag, integri
       <div style={{
         padding: '1rem',
         borderRadius: '0.5rem',
-        backgroundColor: getStatusBg(integrityStatusLabel),
-        border: `1px solid ${getStatusBorder(integrityStatusLabel)}`
+        backgroundColor: statusStyle.bg,
+        border: `1px solid ${statusStyle.border}`
       }}>
         <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center' }}>
           <label style={{ fontSize: '0.875rem', color: '#cbd5e1', fontWeight: '500' }}>Status</label>
           <span style={{
             padding: '0.25rem 0.75rem',
             borderRadius: '9999px',
-            backgroundColor: getStatusColor(integrityStatusLabel),
+            backgroundColor: statusStyle.color,
             color: '#0f172a',
             fontSize: '0.75rem',
             fontWeight: '600'
@@ -1,4 +1,12 @@
-import { useState } from 'react'
+import { useMemo, useState } from 'react'
+
+const EDGES = [
+  { from: '1', to: '2' },
+  { from: '1', to: '3' },
+  { from: '2', to: '4' },
+  { from: '2', to: '5' },
+  { from: '3', to: '6' },
+]
 
 export default function LogicTreeCanvas() {
   const [nodes] = useState([
@@ -10,21 +18,16 @@ export default function LogicTreeCanvas() {
     { id: '6', label: 'Evidence C', x: 450, y: 220 },
   ])
 
-  const edges = [
-    { from: 1, to: 2 },
-    { from: 1, to: 3 },
-    { from: 2, to: 4 },
-    { from: 2, to: 5 },
-    { from: 3, to: 6 },
-  ]
+  // Index nodes by id so each edge resolves its endpoints without scanning
+  const nodesById = useMemo(() => new Map(nodes.map(n => [n.id, n])), [nodes])
 
   // Function to draw lines between nodes
   const renderCanvas = () => {
     return (
       <svg style={{ position: 'absolute', top: 0, left: 0, width: '100%', height: '100%' }}>
-        {edges.map((edge, idx) => {
-          const fromNode = nodes.find(n => n.id === String(edge.from))
-          const toNode = nodes.find(n => n.id === String(edge.to))
+        {EDGES.map((edge, idx) => {
+          const fromNode = nodesById.get(edge.from)
+          const toNode = nodesById.get(edge.to)
           return (
             <line
               key={idx}
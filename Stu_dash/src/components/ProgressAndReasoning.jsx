@@ -1,21 +1,13 @@
-export default function ProgressAndReasoning({ learningProgress, semanticChange, reasoningContinuity }) {
-  const getReasoningColor = (continuity) => {
-    switch(continuity) {
-      case 'HIGH': return '#4ade80'
-      case 'MEDIUM': return '#facc15'
-      case 'LOW': return '#ef4444'
-      default: return '#94a3b8'
-    }
-  }
+const REASONING_STYLES = {
+  HIGH: { color: '#4ade80', bg: 'rgba(74, 222, 128, 0.1)' },
+  MEDIUM: { color: '#facc15', bg: 'rgba(250, 204, 21, 0.1)' },
+  LOW: { color: '#ef4444', bg: 'rgba(239, 68, 68, 0.1)' }
+}
 
-  const getReasoningBg = (continuity) => {
-    switch(continuity) {
-      case 'HIGH': return 'rgba(74, 222, 128, 0.1)'
-      case 'MEDIUM': return 'rgba(250, 204, 21, 0.1)'
-      case 'LOW': return 'rgba(239, 68, 68, 0.1)'
-      default: return 'rgba(148, 163, 184, 0.1)'
-    }
-  }
+const DEFAULT_REASONING_STYLE = { color: '#94a3b8', bg: 'rgba(148, 163, 184, 0.1)' }
+
+export default function ProgressAndReasoning({ learningProgress, semanticChange, reasoningContinuity }) {
+  const reasoningStyle = REASONING_STYLES[reasoningContinuity] || DEFAULT_REASONING_STYLE
 
   return (
     <div style={{
@@ -75,15 +67,15 @@ export default function ProgressAndReasoning({ learningProgress, semanticChange,
       <div style={{
         padding: '1rem',
         borderRadius: '0.5rem',
-        backgroundColor: getReasoningBg(reasoningContinuity),
-        border: `1px solid ${getReasoningColor(reasoningContinuity)}`
+        backgroundColor: reasoningStyle.bg,
+        border: `1px solid ${reasoningStyle.color}`
       }}>
         <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center' }}>
           <label style={{ fontSize: '0.875rem', color: '#cbd5e1', fontWeight: '500' }}>Reasoning Continuity</label>
           <span style={{
             padding: '0.25rem 0.75rem',
             borderRadius: '9999px',
-            backgroundColor: getReasoningColor(reasoningContinuity),
+            backgroundColor: reasoningStyle.color,
             color: '#0f172a',
             fontSize: '0.75rem',
             fontWeight: '600'
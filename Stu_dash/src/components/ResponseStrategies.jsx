@@ -1,35 +1,35 @@
-export default function ResponseStrategies({ learningState, currentConcept }) {
-  const strategies = {
-    PLATEAU: {
-      icon: '🎯',
-      title: 'The Socratic Pivot',
-      description: 'Stop giving direct answers. Ask a high-level conceptual question to break the cycle.',
-      action: 'Reflect on the core principles',
-      color: '#facc15',
-      bgColor: 'rgba(250, 204, 21, 0.1)',
-      borderColor: 'rgba(250, 204, 21, 0.3)'
-    },
-    STALLED: {
-      icon: '📚',
-      title: 'Scaffolding',
-      description: 'Provide a partial solution or a simplified analogy to lower the cognitive barrier.',
-      action: 'Break it into smaller steps',
-      color: '#f97316',
-      bgColor: 'rgba(249, 115, 22, 0.1)',
-      borderColor: 'rgba(249, 115, 22, 0.3)'
-    },
-    PROGRESSING: {
-      icon: '🚀',
-      title: 'Reinforcement & Challenge',
-      description: 'Introduce a "Challenge" variable to push toward the next difficulty level.',
-      action: 'Take the next challenge',
-      color: '#4ade80',
-      bgColor: 'rgba(74, 222, 128, 0.1)',
-      borderColor: 'rgba(74, 222, 128, 0.3)'
-    }
+const STRATEGIES = {
+  PLATEAU: {
+    icon: '🎯',
+    title: 'The Socratic Pivot',
+    description: 'Stop giving direct answers. Ask a high-level conceptual question to break the cycle.',
+    action: 'Reflect on the core principles',
+    color: '#facc15',
+    bgColor: 'rgba(250, 204, 21, 0.1)',
+    borderColor: 'rgba(250, 204, 21, 0.3)'
+  },
+  STALLED: {
+    icon: '📚',
+    title: 'Scaffolding',
+    description: 'Provide a partial solution or a simplified analogy to lower the cognitive barrier.',
+    action: 'Break it into smaller steps',
+    color: '#f97316',
+    bgColor: 'rgba(249, 115, 22, 0.1)',
+    borderColor: 'rgba(249, 115, 22, 0.3)'
+  },
+  PROGRESSING: {
+    icon: '🚀',
+    title: 'Reinforcement & Challenge',
+    description: 'Introduce a "Challenge" variable to push toward the next difficulty level.',
+    action: 'Take the next challenge',
+    color: '#4ade80',
+    bgColor: 'rgba(74, 222, 128, 0.1)',
+    borderColor: 'rgba(74, 222, 128, 0.3)'
   }
+}
 
-  const strategy = strategies[learningState] || strategies.PROGRESSING
+export default function ResponseStrategies({ learningState, currentConcept }) {
+  const strategy = STRATEGIES[learningState] || STRATEGIES.PROGRESSING
 
   return (
     <div style={{
@@ -1,3 +1,25 @@
+const STATE_STYLES = {
+  PROGRESSING: { color: '#4ade80', bg: 'rgba(74, 222, 128, 0.1)', border: 'rgba(74, 222, 128, 0.3)' },
+  PLATEAU: { color: '#facc15', bg: 'rgba(250, 204, 21, 0.1)', border: 'rgba(250, 204, 21, 0.3)' },
+  STALLED: { color: '#ef4444', bg: 'rgba(239, 68, 68, 0.1)', border: 'rgba(239, 68, 68, 0.3)' }
+}
+
+const RISK_STYLES = {
+  LOW: { color: '#4ade80', bg: 'rgba(74, 222, 128, 0.1)', border: 'rgba(74, 222, 128, 0.3)' },
+  MEDIUM: { color: '#facc15', bg: 'rgba(250, 204, 21, 0.1)', border: 'rgba(250, 204, 21, 0.3)' },
+  HIGH: { color: '#ef4444', bg: 'rgba(239, 68, 68, 0.1)', border: 'rgba(239, 68, 68, 0.3)' }
+}
+
+const DEFAULT_STYLE = { color: '#94a3b8', bg: 'rgba(148, 163, 184, 0.1)', border: 'rgba(148, 163, 184, 0.3)' }
+
+const STRATEGY_MESSAGES = {
+  PLATEAU: '🎯 The Socratic Pivot: Let\'s take a step back. Can you explain the core concept in your own words?',
+  STALLED: '📚 Scaffolding: Let\'s break this down into smaller steps. Here\'s a hint to get you started.',
+  PROGRESSING: '🚀 Reinforcement: You\'re doing great! Ready for the next challenge?'
+}
+
+const DEFAULT_STRATEGY_MESSAGE = 'Keep working at your own pace. You\'ve got this!'
+
 export default function StagnationDetection({ 
   stagnationDurationMinutes, 
   repeatAttemptCount, 
@@ -5,72 +27,8 @@ export default function StagnationDetection({
   learningState, 
   dropoutRiskLevel 
 }) {
-  const getStateColor = (state) => {
-    switch(state) {
-      case 'PROGRESSING': return '#4ade80'
-      case 'PLATEAU': return '#facc15'
-      case 'STALLED': return '#ef4444'
-      default: return '#94a3b8'
-    }
-  }
-
-  const getStateBg = (state) => {
-    switch(state) {
-      case 'PROGRESSING': return 'rgba(74, 222, 128, 0.1)'
-      case 'PLATEAU': return 'rgba(250, 204, 21, 0.1)'
-      case 'STALLED': return 'rgba(239, 68, 68, 0.1)'
-      default: return 'rgba(148, 163, 184, 0.1)'
-    }
-  }
-
-  const getStateBorder = (state) => {
-    switch(state) {
-      case 'PROGRESSING': return 'rgba(74, 222, 128, 0.3)'
-      case 'PLATEAU': return 'rgba(250, 204, 21, 0.3)'
-      case 'STALLED': return 'rgba(239, 68, 68, 0.3)'
-      default: return 'rgba(148, 163, 184, 0.3)'
-    }
-  }
-
-  const getRiskColor = (risk) => {
-    switch(risk) {
-      case 'LOW': return '#4ade80'
-      case 'MEDIUM': return '#facc15'
-      case 'HIGH': return '#ef4444'
-      default: return '#94a3b8'
-    }
-  }
-
-  const getRiskBg = (risk) => {
-    switch(risk) {
-      case 'LOW': return 'rgba(74, 222, 128, 0.1)'
-      case 'MEDIUM': return 'rgba(250, 204, 21, 0.1)'
-      case 'HIGH': return 'rgba(239, 68, 68, 0.1)'
-      default: return 'rgba(148, 163, 184, 0.1)'
-    }
-  }
-
-  const getRiskBorder = (risk) => {
-    switch(risk) {
-      case 'LOW': return 'rgba(74, 222, 128, 0.3)'
-      case 'MEDIUM': return 'rgba(250, 204, 21, 0.3)'
-      case 'HIGH': return 'rgba(239, 68, 68, 0.3)'
-      default: return 'rgba(148, 163, 184, 0.3)'
-    }
-  }
-
-  const getStrategyMessage = (state) => {
-    switch(state) {
-      case 'PLATEAU':
-        return '🎯 The Socratic Pivot: Let\'s take a step back. Can you explain the core concept in your own words?'
-      case 'STALLED':
-        return '📚 Scaffolding: Let\'s break this down into smaller steps. Here\'s a hint to get you started.'
-      case 'PROGRESSING':
-        return '🚀 Reinforcement: You\'re doing great! Ready for the next challenge?'
-      default:
-        return 'Keep working at your own pace. You\'ve got this!'
-    }
-  }
+  const stateStyle = STATE_STYLES[learningState] || DEFAULT_STYLE
+  const riskStyle = RISK_STYLES[dropoutRiskLevel] || DEFAULT_STYLE
 
   return (
     <div style={{
@@ -143,8 +101,8 @@ export default function StagnationDetection({
       <div style={{
         padding: '1rem',
         borderRadius: '0.5rem',
-        backgroundColor: getStateBg(learningState),
-        border: `1px solid ${getStateBorder(learningState)}`,
+        backgroundColor: stateStyle.bg,
+        border: `1px solid ${stateStyle.border}`,
         marginBottom: '1rem'
       }}>
         <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', marginBottom: '0.5rem' }}>
@@ -152,7 +110,7 @@ export default function StagnationDetection({
           <span style={{
             padding: '0.25rem 0.75rem',
             borderRadius: '9999px',
-            backgroundColor: getStateColor(learningState),
+            backgroundColor: stateStyle.color,
             color: '#0f172a',
             fontSize: '0.75rem',
             fontWeight: '600'
@@ -161,7 +119,7 @@ export default function StagnationDetection({
           </span>
         </div>
         <p style={{ fontSize: '0.75rem', color: '#94a3b8' }}>
-          {getStrategyMessage(learningState)}
+          {STRATEGY_MESSAGES[learningState] || DEFAULT_STRATEGY_MESSAGE}
         </p>
       </div>
 
@@ -169,15 +127,15 @@ export default function StagnationDetection({
       <div style={{
         padding: '1rem',
         borderRadius: '0.5rem',
-        backgroundColor: getRiskBg(dropoutRiskLevel),
-        border: `1px solid ${getRiskBorder(dropoutRiskLevel)}`
+        backgroundColor: riskStyle.bg,
+        border: `1px solid ${riskStyle.border}`
       }}>
         <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', marginBottom: '0.5rem' }}>
           <label style={{ fontSize: '0.875rem', color: '#cbd5e1', fontWeight: '500' }}>Engagement Risk</label>
           <span style={{
             padding: '0.25rem 0.75rem',
             borderRadius: '9999px',
-            backgroundColor: getRiskColor(dropoutRiskLevel),
+            backgroundColor: riskStyle.color,
             color: '#0f172a',
             fontSize: '0.75rem',
             fontWeight: '600'
@@ -0,0 +1,20 @@
+// Concept difficulty (1-5) presentation shared by the assignment and concept pickers
+const DIFFICULTY_COLORS = {
+  1: '#4ade80',
+  2: '#60a5fa',
+  3: '#facc15',
+  4: '#f97316',
+  5: '#ef4444'
+}
+
+const DIFFICULTY_LABELS = {
+  1: 'Intro',
+  2: 'Beginner',
+  3: 'Intermediate',
+  4: 'Advanced',
+  5: 'Expert'
+}
+
+export const difficultyColor = (level) => DIFFICULTY_COLORS[level] || '#94a3b8'
+
+export const difficultyLabel = (level) => DIFFICULTY_LABELS[level] || 'Unknown'
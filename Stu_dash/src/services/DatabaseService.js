@@ -8,29 +8,68 @@ class DatabaseService {
   constructor() {
     this.baseUrl = 'http://localhost:3001/api'
     this.localStorageKey = 'student_integrity_data'
-    this.initializeLocalStorage()
+    this.maxActionLogEntries = 256
+    // Parsed copy of the stored blob so reads don't re-parse localStorage
+    this.cache = null
+
+    // Drop the cached copy when another tab writes the same key
+    window.addEventListener('storage', (event) => {
+      if (event.key === this.localStorageKey) {
+        this.cache = null
+      }
+    })
   }
 
-  initializeLocalStorage() {
-    if (!localStorage.getItem(this.localStorageKey)) {
-      localStorage.setItem(this.localStorageKey, JSON.stringify({
-        integrityScore: 85,
-        workstreams: [],
-        assignments: [],
-        lastUpdated: new Date().toISOString()
-      }))
+  // Trace output is only emitted in dev builds; production skips the console I/O
+  debug(...args) {
+    if (import.meta.env.DEV) {
+      console.log('[DB Service]', ...args)
+    }
+  }
+
+  // Storage is seeded on first use rather than when the module is imported
+  readData() {
+    if (this.cache) {
+      return this.cache
+    }
+
+    const stored = localStorage.getItem(this.localStorageKey)
+    if (stored) {
+      this.cache = JSON.parse(stored)
+      return this.cache
+    }
+
+    const data = {
+      integrityScore: 85,
+      workstreams: [],
+      assignments: [],
+      lastUpdated: new Date().toISOString()
+    }
+    this.writeData(data)
+    return data
+  }
+
+  writeData(data) {
+    try {
+      localStorage.setItem(this.localStorageKey, JSON.stringify(data))
+      this.cache = data
+    } catch (error) {
+      // Callers mutate the cached object before writing; drop it so the next
+      // read comes from what was actually stored
+      this.cache = null
+      throw error
     }
   }
 
   async updateIntegrityScore(studentId, newScore) {
     try {
-      console.log(`[DB Service] Updating integrity score for student ${studentId}: ${newScore}`)
+      this.debug(`Updating integrity score for student ${studentId}: ${newScore}`)
       
       // Store in local storage
-      const data = JSON.parse(localStorage.getItem(this.localStorageKey))
+      const data = this.readData()
       data.integrityScore = newScore
       data.lastUpdated = new Date().toISOString()
-      localStorage.setItem(this.localStorageKey, JSON.stringify(data))
+      this.writeData(data)
 
       // In a real app, this would be an API call
       // const response = await fetch(`${this.baseUrl}/students/${studentId}/integrity-score`, {
@@ -49,9 +88,9 @@ class DatabaseService {
 
   async recordWorkstreamUpdate(studentId, workstreamId, data) {
     try {
-      console.log(`[DB Service] Recording workstream update: ${workstreamId}`, data)
+      this.debug(`Recording workstream update: ${workstreamId}`, data)
 
-      const storageData = JSON.parse(localStorage.getItem(this.localStorageKey))
+      const storageData = this.readData()
       
       if (!storageData.workstreams) {
         storageData.workstreams = []
@@ -72,7 +111,7 @@ class DatabaseService {
         })
       }
 
-      localStorage.setItem(this.localStorageKey, JSON.stringify(storageData))
+      this.writeData(storageData)
 
       // In a real app:
       // const response = await fetch(`${this.baseUrl}/students/${studentId}/workstreams/${workstreamId}`, {
@@ -91,7 +130,8 @@ class DatabaseService {
 
   async getStudentData(studentId) {
     try {
-      const data = JSON.parse(localStorage.getItem(this.localStorageKey))
+      // Hand out a copy so callers can't mutate the cached blob
+      const data = structuredClone(this.readData())
       return { success: true, data }
     } catch (error) {
       console.error('Error retrieving student data:', error)
@@ -101,7 +141,7 @@ class DatabaseService {
 
   async logAction(studentId, action, metadata = {}) {
     try {
-      console.log(`[DB Service] Logging action: ${action}`, metadata)
+      this.debug(`Logging action: ${action}`, metadata)
       
       const timestamp = new Date().toISOString()
       const log = {
@@ -112,12 +152,16 @@ class DatabaseService {
       }
 
       // Store in local storage
-      const data = JSON.parse(localStorage.getItem(this.localStorageKey))
+      const data = this.readData()
       if (!data.actionLog) {
         data.actionLog = []
       }
       data.actionLog.push(log)
-      localStorage.setItem(this.localStorageKey, JSON.stringify(data))
+      // Keep only the most recent entries so the log can't exhaust the storage quota
+      if (data.actionLog.length > this.maxActionLogEntries) {
+        data.actionLog.splice(0, data.actionLog.length - this.maxActionLogEntries)
+      }
+      this.writeData(data)
 
       // In a real app, send to server for audit trail
       return { success: true }
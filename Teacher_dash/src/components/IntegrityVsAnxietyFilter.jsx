@@ -1,44 +1,50 @@
+import { useState } from 'react'
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card'
+import { LOW_INTEGRITY_SCORE, HIGH_INTEGRITY_SCORE } from '../lib/thresholds'
 
-export default function IntegrityVsAnxietyFilter({ students }) {
-  // Filter students by integrity and competition pressure
-  const categorizedStudents = {
-    anxious: students.filter(s => s.integrityScore < 60 && s.competitionPressureFlag),
-    cheating: students.filter(s => s.integrityScore < 60 && !s.competitionPressureFlag),
-    confident: students.filter(s => s.integrityScore >= 80),
-    consistent: students.filter(s => s.integrityScore >= 60 && s.integrityScore < 80)
-  }
+const PAGE_SIZE = 12
 
-  const getCategory = (integrityScore, competitionPressure) => {
-    if (integrityScore < 60 && competitionPressure) return 'Performance Anxiety'
-    if (integrityScore < 60 && !competitionPressure) return 'Potential Integrity Issue'
-    if (integrityScore >= 80) return 'High Confidence'
-    return 'Consistent Performer'
+const CATEGORIES = {
+  anxious: {
+    label: 'Performance Anxiety',
+    colors: { bg: 'rgba(251, 146, 60, 0.1)', border: 'rgba(251, 146, 60, 0.3)', text: '#fb923c' },
+    action: '💪 Provide encouragement & peer support. Review their logic—it\'s solid!'
+  },
+  cheating: {
+    label: 'Potential Integrity Issue',
+    colors: { bg: 'rgba(239, 68, 68, 0.1)', border: 'rgba(239, 68, 68, 0.3)', text: '#ef4444' },
+    action: '⚠️ Manual review required. Check for copy-paste or external tool usage.'
+  },
+  confident: {
+    label: 'High Confidence',
+    colors: { bg: 'rgba(74, 222, 128, 0.1)', border: 'rgba(74, 222, 128, 0.3)', text: '#4ade80' },
+    action: '🌟 Encourage to mentor struggling peers or tackle advanced topics.'
+  },
+  consistent: {
+    label: 'Consistent Performer',
+    colors: { bg: 'rgba(96, 165, 250, 0.1)', border: 'rgba(96, 165, 250, 0.3)', text: '#60a5fa' },
+    action: '✅ Monitor progress. Encourage consistency.'
   }
+}
 
-  const getCategoryColor = (category) => {
-    switch(category) {
-      case 'Performance Anxiety': return { bg: 'rgba(251, 146, 60, 0.1)', border: 'rgba(251, 146, 60, 0.3)', text: '#fb923c' }
-      case 'Potential Integrity Issue': return { bg: 'rgba(239, 68, 68, 0.1)', border: 'rgba(239, 68, 68, 0.3)', text: '#ef4444' }
-      case 'High Confidence': return { bg: 'rgba(74, 222, 128, 0.1)', border: 'rgba(74, 222, 128, 0.3)', text: '#4ade80' }
-      default: return { bg: 'rgba(96, 165, 250, 0.1)', border: 'rgba(96, 165, 250, 0.3)', text: '#60a5fa' }
-    }
-  }
+export default function IntegrityVsAnxietyFilter({ students }) {
+  const [visibleCount, setVisibleCount] = useState(PAGE_SIZE)
 
-  const getCategoryAction = (category) => {
-    switch(category) {
-      case 'Performance Anxiety': return '💪 Provide encouragement & peer support. Review their logic—it\'s solid!'
-      case 'Potential Integrity Issue': return '⚠️ Manual review required. Check for copy-paste or external tool usage.'
-      case 'High Confidence': return '🌟 Encourage to mentor struggling peers or tackle advanced topics.'
-      default: return '✅ Monitor progress. Encourage consistency.'
-    }
+  // Filter students by integrity and competition pressure
+  const categorizedStudents = {
+    anxious: students.filter(s => s.integrityScore < LOW_INTEGRITY_SCORE && s.competitionPressureFlag),
+    cheating: students.filter(s => s.integrityScore < LOW_INTEGRITY_SCORE && !s.competitionPressureFlag),
+    confident: students.filter(s => s.integrityScore >= HIGH_INTEGRITY_SCORE),
+    consistent: students.filter(s => s.integrityScore >= LOW_INTEGRITY_SCORE && s.integrityScore < HIGH_INTEGRITY_SCORE)
   }
 
+  // Only the fields the cards render, rather than a copy of each full student record
+  const toCard = (category) => (s) => ({ id: s.id, name: s.name, integrityScore: s.integrityScore, category })
   const allCategorizedStudents = [
-    ...categorizedStudents.anxious.map(s => ({ ...s, category: 'Performance Anxiety' })),
-    ...categorizedStudents.cheating.map(s => ({ ...s, category: 'Potential Integrity Issue' })),
-    ...categorizedStudents.confident.map(s => ({ ...s, category: 'High Confidence' })),
-    ...categorizedStudents.consistent.map(s => ({ ...s, category: 'Consistent Performer' }))
+    ...categorizedStudents.anxious.map(toCard('anxious')),
+    ...categorizedStudents.cheating.map(toCard('cheating')),
+    ...categorizedStudents.confident.map(toCard('confident')),
+    ...categorizedStudents.consistent.map(toCard('consistent'))
   ]
 
   return (
@@ -57,8 +63,9 @@ export default function IntegrityVsAnxietyFilter({ students }) {
       </CardHeader>
       <CardContent>
         <div style={{ display: 'grid', gridTemplateColumns: 'repeat(auto-fill, minmax(280px, 1fr))', gap: '1rem', maxHeight: '400px', overflowY: 'auto' }}>
-          {allCategorizedStudents.slice(0, 12).map((student) => {
-            const colors = getCategoryColor(student.category)
+          {allCategorizedStudents.slice(0, visibleCount).map((student) => {
+            const category = CATEGORIES[student.category]
+            const colors = category.colors
             return (
               <div
                 key={student.id}
@@ -86,20 +93,37 @@ export default function IntegrityVsAnxietyFilter({ students }) {
                     fontSize: '0.65rem',
                     fontWeight: '600'
                   }}>
-                    {student.category}
+                    {category.label}
                   </span>
                 </div>
                 <p style={{ fontSize: '0.75rem', color: '#cbd5e1', marginBottom: '0.5rem', lineHeight: '1.4' }}>
-                  {getCategoryAction(student.category)}
+                  {category.action}
                 </p>
               </div>
             )
           })}
         </div>
-        {allCategorizedStudents.length > 12 && (
-          <p style={{ fontSize: '0.75rem', color: '#94a3b8', marginTop: '1rem', textAlign: 'center' }}>
-            Showing 12 of {allCategorizedStudents.length} students. Scroll to see more.
-          </p>
+        {allCategorizedStudents.length > visibleCount && (
+          <div style={{ marginTop: '1rem', textAlign: 'center' }}>
+            <p style={{ fontSize: '0.75rem', color: '#94a3b8', marginBottom: '0.5rem' }}>
+              Showing {visibleCount} of {allCategorizedStudents.length} students.
+            </p>
+            <button
+              onClick={() => setVisibleCount(count => count + PAGE_SIZE)}
+              style={{
+                padding: '0.375rem 1rem',
+                backgroundColor: 'transparent',
+                color: '#cbd5e1',
+                borderRadius: '0.25rem',
+                border: '1px solid rgba(71, 85, 105, 0.5)',
+                fontSize: '0.75rem',
+                fontWeight: '600',
+                cursor: 'pointer'
+              }}
+            >
+              Show more
+            </button>
+          </div>
         )}
       </CardContent>
     </Card>
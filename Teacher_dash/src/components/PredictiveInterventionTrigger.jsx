@@ -1,4 +1,5 @@
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card'
+import { STAGNATION_ALERT_MINUTES, HIGH_RISK_STAGNATION_MINUTES } from '../lib/thresholds'
 
 export default function PredictiveInterventionTrigger({ students }) {
   // Filter students with high reasoning continuity but dropping confidence
@@ -7,11 +8,11 @@ export default function PredictiveInterventionTrigger({ students }) {
   )
 
   const stagnatedStudents = students.filter(s =>
-    s.stagnationDurationMinutes > 15 && !s.impostorSyndrome
+    s.stagnationDurationMinutes > STAGNATION_ALERT_MINUTES && !s.impostorSyndrome
   )
 
   const burnoutRiskStudents = students.filter(s =>
-    s.stagnationDurationMinutes > 20 && s.dayOfWeek === 'Friday'
+    s.stagnationDurationMinutes > HIGH_RISK_STAGNATION_MINUTES && s.dayOfWeek === 'Friday'
   )
 
   return (
@@ -12,6 +12,8 @@ import { Badge } from './ui/badge';
 import { Button } from './ui/button';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from './ui/card';
 
+const GRIT_ORDER = { 'Low': 1, 'Medium': 2, 'High': 3, 'Elite': 4 };
+
 export default function StruggleHeatmap({ students, onViewStudent }) {
     const [sortConfig, setSortConfig] = useState({ key: 'integrityScore', direction: 'desc' });
 
@@ -27,10 +29,9 @@ export default function StruggleHeatmap({ students, onViewStudent }) {
         const bValue = b[sortConfig.key];
 
         if (sortConfig.key === 'gritLevel') {
-            const gritOrder = { 'Low': 1, 'Medium': 2, 'High': 3, 'Elite': 4 };
             return sortConfig.direction === 'asc'
-                ? gritOrder[aValue] - gritOrder[bValue]
-                : gritOrder[bValue] - gritOrder[aValue];
+                ? GRIT_ORDER[aValue] - GRIT_ORDER[bValue]
+                : GRIT_ORDER[bValue] - GRIT_ORDER[aValue];
         }
 
         if (typeof aValue === 'number') {
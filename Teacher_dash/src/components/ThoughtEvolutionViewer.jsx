@@ -1,14 +1,26 @@
-import { useState } from 'react';
+import { useMemo, useState } from 'react';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from './ui/card';
 import { Badge } from './ui/badge';
 import { AlertTriangle, TrendingUp, Activity } from 'lucide-react';
 
+const timestampFormat = new Intl.DateTimeFormat('en-US', {
+    month: 'short',
+    day: 'numeric',
+    hour: '2-digit',
+    minute: '2-digit',
+});
+
+const formatDate = (timestamp) => timestampFormat.format(new Date(timestamp));
+
 export default function ThoughtEvolutionViewer({ student }) {
     const [selectedIndex, setSelectedIndex] = useState(student.thoughtEvolution.length - 1);
 
     const evolution = student.thoughtEvolution;
     const currentState = evolution[selectedIndex];
 
+    // Tallest bar in the growth pattern; computed once rather than per bar
+    const maxNodes = useMemo(() => Math.max(...evolution.map(s => s.nodes)), [evolution]);
+
     // Detect suspicious jumps (large increase in nodes/connections in short time)
     const detectSuspiciousJump = (index) => {
         if (index === 0) return false;
@@ -33,15 +45,6 @@ export default function ThoughtEvolutionViewer({ student }) {
         }
     };
 
-    const formatDate = (timestamp) => {
-        return new Date(timestamp).toLocaleDateString('en-US', {
-            month: 'short',
-            day: 'numeric',
-            hour: '2-digit',
-            minute: '2-digit',
-        });
-    };
-
     return (
         <Card className="bg-midnight-light border-electric/20">
             <CardHeader>
@@ -131,7 +134,7 @@ export default function ThoughtEvolutionViewer({ student }) {
                         {evolution.map((state, index) => {
                             const isSuspicious = detectSuspiciousJump(index);
                             const isSelected = index === selectedIndex;
-                            const height = (state.nodes / Math.max(...evolution.map(s => s.nodes))) * 100;
+                            const height = (state.nodes / maxNodes) * 100;
 
                             return (
                                 <div
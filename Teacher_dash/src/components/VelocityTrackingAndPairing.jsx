@@ -4,7 +4,8 @@ export default function VelocityTrackingAndPairing({ students }) {
   // Calculate velocity: Progress / Time (assuming time is stagnation duration inversely)
   const velocityStudents = students.map(student => {
     const velocity = student.learningProgressScore / Math.max(student.stagnationDurationMinutes, 1)
-    return { ...student, velocity }
+    // Only the fields the velocity cards render
+    return { id: student.id, name: student.name, velocity }
   }).sort((a, b) => b.velocity - a.velocity)
 
   const speedRunners = velocityStudents.filter(s => s.velocity > 5).slice(0, 5)
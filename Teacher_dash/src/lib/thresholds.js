@@ -0,0 +1,6 @@
+// Classroom thresholds shared by the dashboard and the ECI panels.
+// Integrity scores are 0-100; stagnation durations are in minutes.
+export const LOW_INTEGRITY_SCORE = 60
+export const HIGH_INTEGRITY_SCORE = 80
+export const STAGNATION_ALERT_MINUTES = 15
+export const HIGH_RISK_STAGNATION_MINUTES = 20
@@ -1,15 +1,19 @@
-import { useState } from 'react';
+import { lazy, Suspense, useMemo, useState } from 'react';
 import Header from '../components/Header';
 import StruggleHeatmap from '../components/StruggleHeatmap';
-import StudentDetailDialog from '../components/StudentDetailDialog';
 import ClassroomHealthOverview from '../components/ClassroomHealthOverview';
 import IntegrityVsAnxietyFilter from '../components/IntegrityVsAnxietyFilter';
 import PredictiveInterventionTrigger from '../components/PredictiveInterventionTrigger';
 import VelocityTrackingAndPairing from '../components/VelocityTrackingAndPairing';
 import { mockStudents } from '../data/mockStudentData';
+import { LOW_INTEGRITY_SCORE, HIGH_RISK_STAGNATION_MINUTES } from '../lib/thresholds';
 import { Users, TrendingUp, AlertTriangle, Award } from 'lucide-react';
 import { Card, CardContent, CardHeader, CardTitle } from '../components/ui/card';
 
+// The detail dialog (tabs, evolution viewer, Socratic auditor) is only needed
+// once a student is opened, so it is split out of the initial bundle.
+const StudentDetailDialog = lazy(() => import('../components/StudentDetailDialog'));
+
 export default function TeacherDashboard() {
     const [students, setStudents] = useState(mockStudents);
     const [selectedStudent, setSelectedStudent] = useState(null);
@@ -30,32 +34,69 @@ export default function TeacherDashboard() {
         );
     };
 
-    // Calculate statistics
-    const totalStudents = students.length;
-    const avgIntegrityScore = (students.reduce((sum, s) => sum + s.integrityScore, 0) / totalStudents).toFixed(1);
-    const atRiskStudents = students.filter(s => s.integrityScore < 60).length;
-    const certificatesIssued = students.filter(s => s.socraticResults.certificateApproved).length;
-    
-    // Calculate ECI metrics
-    const studentsActive = students.filter(s => s.isActive !== false).length;
-    const studentsFlagged = students.filter(s => s.integrityScore < 60 || s.suddenJumpFlag).length;
-    const studentsHighRisk = students.filter(s => s.dropoutRiskLevel === 'HIGH' || s.stagnationDurationMinutes > 20).length;
-    const averageProgressScore = Math.round(students.reduce((sum, s) => sum + (s.learningProgressScore || 0), 0) / totalStudents);
+    // Calculate statistics and ECI metrics in a single pass over the roster.
+    // Memoized on the roster so dialog open/close re-renders reuse the result.
+    const {
+        totalStudents,
+        avgIntegrityScore,
+        atRiskStudents,
+        certificatesIssued,
+        studentsActive,
+        studentsFlagged,
+        studentsHighRisk,
+        averageProgressScore,
+        topStickingPoint,
+    } = useMemo(() => {
+        let integrityTotal = 0;
+        let progressTotal = 0;
+        let atRiskStudents = 0;
+        let certificatesIssued = 0;
+        let studentsActive = 0;
+        let studentsFlagged = 0;
+        let studentsHighRisk = 0;
+        const conceptCounts = {};
+        for (const s of students) {
+            const lowIntegrity = s.integrityScore < LOW_INTEGRITY_SCORE;
+            integrityTotal += s.integrityScore;
+            progressTotal += s.learningProgressScore || 0;
+            if (lowIntegrity) atRiskStudents++;
+            if (s.socraticResults.certificateApproved) certificatesIssued++;
+            if (s.isActive !== false) studentsActive++;
+            if (lowIntegrity || s.suddenJumpFlag) studentsFlagged++;
+            if (s.dropoutRiskLevel === 'HIGH' || s.stagnationDurationMinutes > HIGH_RISK_STAGNATION_MINUTES) studentsHighRisk++;
+            if (s.conceptName) {
+                conceptCounts[s.conceptName] = (conceptCounts[s.conceptName] || 0) + 1;
+            }
+        }
+
+        // Find top sticking point
+        let topStickingPoint = 'None identified';
+        let topStickingCount = 0;
+        for (const concept in conceptCounts) {
+            if (conceptCounts[concept] > topStickingCount) {
+                topStickingPoint = concept;
+                topStickingCount = conceptCounts[concept];
+            }
+        }
+
+        return {
+            totalStudents: students.length,
+            avgIntegrityScore: (integrityTotal / students.length).toFixed(1),
+            atRiskStudents,
+            certificatesIssued,
+            studentsActive,
+            studentsFlagged,
+            studentsHighRisk,
+            averageProgressScore: Math.round(progressTotal / students.length),
+            topStickingPoint,
+        };
+    }, [students]);
     
     // Determine stagnation trend
     const stagnationTrend = averageProgressScore < 50 && studentsHighRisk > totalStudents * 0.2
       ? '⚠️ Average progress has dropped 15%+ while stagnation increases. Material may need re-explanation.'
       : null;
     
-    // Find top sticking point
-    const conceptCounts = {};
-    students.forEach(s => {
-      if (s.conceptName) {
-        conceptCounts[s.conceptName] = (conceptCounts[s.conceptName] || 0) + 1;
-      }
-    });
-    const topStickingPoint = Object.entries(conceptCounts).sort(([, a], [, b]) => b - a)[0]?.[0] || 'None identified';
-    
     // Determine classroom health
     const getClassroomHealth = () => {
       if (studentsHighRisk > totalStudents * 0.3) return 'AT-RISK';
@@ -167,12 +208,16 @@ export default function TeacherDashboard() {
                 </div>
 
                 {/* Student Detail Dialog */}
-                <StudentDetailDialog
-                    student={selectedStudent}
-                    open={dialogOpen}
-                    onOpenChange={setDialogOpen}
-                    onApproveCertificate={handleApproveCertificate}
-                />
+                {selectedStudent && (
+                    <Suspense fallback={null}>
+                        <StudentDetailDialog
+                            student={selectedStudent}
+                            open={dialogOpen}
+                            onOpenChange={setDialogOpen}
+                            onApproveCertificate={handleApproveCertificate}
+                        />
+                    </Suspense>
+                )}
             </main>
         </div>
     );